@@ -2,11 +2,20 @@
 # tts_gui.py
 # GUI Text-to-Speech tool using pyttsx3 (offline) + pygame for playback controls.
 
+import io
+import atexit
+import base64
 import os
+import codecs
+import re
 import threading
-import tempfile
 import time
 import json
+import hashlib
+import itertools
+import platform
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
@@ -16,8 +25,71 @@ import ttkbootstrap as tb
 from ttkbootstrap.constants import *
 
 try:
-    from gtts import gTTS
+    import gtts
+    from gtts.tts import gTTSError
+    import requests
+    import urllib.request
+    import urllib3
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     GTTS_AVAILABLE = True
+
+    # gTTS opens a new Session (DNS + TCP + TLS) per request; share one keep-alive
+    # pool instead, sized for the parallel sentence synthesis in _generate_audio
+    _gtts_session = requests.Session()
+    # gTTS POSTs, which urllib3 won't retry by default; the requests are idempotent, so
+    # retry them too, with a short backoff when rate limited. Retry-After is ignored: a
+    # server asking for minutes would otherwise park a speech worker that long
+    _retry_options = dict(total=2, backoff_factor=0.3, status_forcelist=(429, 503),
+                          respect_retry_after_header=False)
+    try:
+        _gtts_retry = Retry(allowed_methods=None, **_retry_options)
+    except TypeError:  # urllib3 < 1.26 spells it method_whitelist
+        _gtts_retry = Retry(method_whitelist=None, **_retry_options)
+    _gtts_session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4,
+                                                max_retries=_gtts_retry))
+    _GTTS_AUDIO_RE = re.compile(r'jQ1olc","\[\\"(.*)\\"]')
+    # (connect, read) seconds; gTTS itself defaults to waiting forever
+    GTTS_TIMEOUT = (3.05, 10)
+
+    def _gtts_version():
+        try:
+            return tuple(int(part) for part in gtts.__version__.split(".")[:2])
+        except (AttributeError, ValueError):
+            return (0, 0)
+
+    # stream() below mirrors private gTTS internals (_prepare_requests and the "jQ1olc"
+    # reply format) as of the 2.2-2.5 releases; any other version keeps its own transport
+    _GTTS_POOLED = (2, 2) <= _gtts_version() < (3, 0) and hasattr(gtts.gTTS, "_prepare_requests")
+    if _GTTS_POOLED:
+        # Same TLS settings as gTTS (verify=False, for intercepting corporate proxies),
+        # and the same silenced warning, set once here rather than on every request
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+    class gTTS(gtts.gTTS):
+        """gTTS that sends its requests over the shared keep-alive session"""
+
+        def stream(self):
+            if not _GTTS_POOLED:
+                yield from super().stream()
+                return
+            for pr in self._prepare_requests():
+                try:
+                    # Session.send() ignores system proxy settings; pass them like gTTS does
+                    r = _gtts_session.send(pr, verify=False, proxies=urllib.request.getproxies(),
+                                           timeout=getattr(self, "timeout", None) or GTTS_TIMEOUT)
+                    r.raise_for_status()
+                except requests.exceptions.HTTPError:
+                    raise gTTSError(tts=self, response=r)
+                except requests.exceptions.RequestException:
+                    raise gTTSError(tts=self)
+                for line in r.iter_lines(chunk_size=1024):
+                    decoded_line = line.decode("utf-8")
+                    if "jQ1olc" in decoded_line:
+                        audio_search = _GTTS_AUDIO_RE.search(decoded_line)
+                        if not audio_search:
+                            raise gTTSError(tts=self, response=r)
+                        yield base64.b64decode(audio_search.group(1).encode("ascii"))
 except ImportError:
     GTTS_AVAILABLE = False
 
@@ -36,11 +108,121 @@ except ImportError:
 try:
     import pygame
     PYGAME_AVAILABLE = True
+    MUSIC_END_EVENT = pygame.USEREVENT + 1
 except ImportError:
     PYGAME_AVAILABLE = False
 
+try:
+    import orjson  # C parser; raises orjson.JSONDecodeError, a json.JSONDecodeError subclass
+    json_loads = orjson.loads
+
+    def json_dumps(obj):
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+
+if WATCHDOG_AVAILABLE:
+    class QueueFileHandler(FileSystemEventHandler):
+        """Invoke a callback whenever the notification queue file is written"""
+        def __init__(self, path, callback):
+            super().__init__()
+            self.path = os.path.normcase(os.path.abspath(path))
+            self.callback = callback
+
+        def _matches(self, path):
+            return os.path.normcase(os.path.abspath(path)) == self.path
+
+        def on_created(self, event):
+            if self._matches(event.src_path):
+                self.callback()
+
+        def on_modified(self, event):
+            if self._matches(event.src_path):
+                self.callback()
+
+        def on_moved(self, event):
+            if self._matches(event.dest_path):
+                self.callback()
+
+
+# Google TTS languages offered in the voice list (shared, never mutated)
+ONLINE_VOICES = (
+    {"name": "Google English (US)", "id": "en", "type": "online"},
+    {"name": "Google English (UK)", "id": "en-uk", "type": "online"},
+    {"name": "Google English (AU)", "id": "en-au", "type": "online"},
+    {"name": "Google Spanish", "id": "es", "type": "online"},
+    {"name": "Google French", "id": "fr", "type": "online"},
+    {"name": "Google German", "id": "de", "type": "online"},
+    {"name": "Google Italian", "id": "it", "type": "online"},
+    {"name": "Google Portuguese", "id": "pt", "type": "online"},
+    {"name": "Google Japanese", "id": "ja", "type": "online"},
+    {"name": "Google Korean", "id": "ko", "type": "online"},
+    {"name": "Google Chinese", "id": "zh", "type": "online"},
+)
+FALLBACK_VOICE = {"name": "Default Voice", "id": "default", "type": "offline"}
+
+# Spoken prefix per notification source; "log:*" sources and anything else are handled in code
+NOTIFICATION_PREFIXES = {"email": "Email: "}
+
 
 class TTSApp:
+    # Synthesized audio is cached here, keyed by voice/rate/volume/text
+    AUDIO_CACHE_DIR = Path.home() / ".cache" / "voice_inbox"
+    AUDIO_CACHE_MAX_BYTES = 200 * 1024 * 1024
+    # Private home for per-process spill files (tts_<pid>.mp3); never the shared temp dir
+    SPILL_DIR = AUDIO_CACHE_DIR / "spill"
+    # Voice list from the last enumeration, reused at startup until Refresh is pressed
+    VOICE_CACHE_FILE = Path.home() / ".cache" / "voice_inbox_voices.json"
+    # Settings that only apply when the mixer opens, kept across restarts
+    SETTINGS_FILE = Path.home() / ".cache" / "voice_inbox_settings.json"
+    # Cached files not played for this long are removed at startup
+    AUDIO_CACHE_TTL_SECONDS = 30 * 24 * 3600
+    # Default mixer buffer in frames (adjustable under Advanced). Latency is frames / rate:
+    # 512 / 24000 Hz is about 21 ms. Raise it (e.g. 4096) if playback crackles on a
+    # heavily loaded machine, lower it for snappier short notifications
+    AUDIO_BUFFER_FRAMES = 512
+    AUDIO_BUFFER_CHOICES = (256, 512, 1024, 2048, 4096)
+    # Matches gTTS's 24 kHz MP3s, which are decoded and played while streaming. System-voice
+    # WAVs (SAPI writes 22.05 kHz) are converted once, when they are loaded as a Sound
+    AUDIO_SAMPLE_RATE = 24000
+    # Concurrent Google TTS requests when generating audio for multi-sentence text
+    SYNTH_WORKERS = 4
+    # Google TTS takes at most 100 characters per request. Generate fetches texts up to
+    # about 500 requests in parallel; longer ones go one request at a time, this far apart
+    GTTS_CHUNK_CHARS = 100
+    ONLINE_PARALLEL_MAX_CHARS = 50_000
+    GTTS_SEQUENTIAL_DELAY = 0.25
+    # Speak downloads this many chunks ahead of playback, and keeps the audio for the
+    # cache only while it stays under this size
+    ONLINE_PREFETCH_CHUNKS = 2
+    ONLINE_CACHE_MAX_BYTES = 8 * 1024 * 1024
+    # Auto-reading speaks queued notifications together, up to this many characters at a time
+    MAX_BATCH_CHARS = 2000
+    # Once this much of the notification queue has been read and spoken it is compacted
+    QUEUE_COMPACT_BYTES = 1 << 20
+    # Identical notifications are spoken once per session; past this many the memory resets
+    SEEN_TEXTS_MAX = 10000
+    SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+    # Offline "Speak" reads a chosen file this many bytes at a time, speaking as it goes
+    FILE_READ_CHUNK = 1 << 20
+    # How often the UI thread drains pygame's queue for end-of-track events
+    MUSIC_PUMP_MS = 50
+    # Status bar repaint interval; bursts of updates in between collapse to the latest
+    STATUS_REFRESH_MS = 50
+    # Reuse the microphone's ambient-noise calibration for this long
+    MIC_RECALIBRATE_SECONDS = 60
+    # Generated WAVs up to this size are decoded into memory once for instant replay
+    SOUND_PRELOAD_MAX_BYTES = 32 * 1024 * 1024
+
     def __init__(self, master):
         self.master = master
         self.master.title("Voice Inbox — Text-to-Speech")
@@ -48,42 +230,124 @@ class TTSApp:
 
         # ---------- State ----------
         self.voices = []
+        self._voice_by_id = {}
         self.selected_voice_id = None
         self.selected_file_path = tk.StringVar(value="")
+        self._text_cache = None  # text area contents as of the last unmodified read
+        self._file_text_key = None  # (path, mtime, size) of the file behind _file_text
+        self._file_text = ""
         self.rate_var = tk.IntVar(value=180)    # sensible default
         self.volume_var = tk.DoubleVar(value=0.9)
+        # Plain-Python copy of (rate, volume), refreshed on the UI thread when a slider
+        # moves, so worker threads never have to call into Tk
+        self._rate_volume = (self.rate_var.get(), self.volume_var.get())
+        self.rate_var.trace_add("write", self._refresh_rate_volume)
+        self.volume_var.trace_add("write", self._refresh_rate_volume)
+        self._audio_buffer = self._load_audio_buffer()  # plain copy read by _ensure_mixer
+        self.audio_buffer_var = tk.IntVar(value=self._audio_buffer)
+        self.audio_buffer_var.trace_add("write", self._refresh_audio_buffer)
         self.current_audio_path = None
+        self._current_sound = None  # pre-decoded pygame Sound for current_audio_path, if any
+        self._audio_path_verified = None  # current_audio_path once seen on disk; skips re-stat
+        self._music_path = None  # file currently loaded into mixer.music, None for in-memory audio
+        self._channel = None  # mixer channel playing _current_sound
+        self._music_done = threading.Event()  # set by the event pump when a music track ends
+        # Reused spill file for online speech when the mixer cannot load from memory
+        self._tts_buf_path = str(self.SPILL_DIR / f"tts_{os.getpid()}.mp3")
+        # Temp files to delete at exit, once the mixer has let go of them
+        self._tmp_cleanup = deque([self._tts_buf_path])
+        atexit.register(self._drain_tmp)
+        threading.Thread(target=self._remove_stale_tmp, daemon=True).start()
+        threading.Thread(target=self._expire_cache, daemon=True).start()
         self.is_generating = False
         self.is_speaking_live = False
         self.tts_engine = "pyttsx3"  # Default to offline
         self.conversation_history = []  # For conversational mode
         self.stop_speech_flag = False  # Flag to stop current speech
         self.status_var = tk.StringVar(value="Ready.")  # moved here so UI can bind
+        self._pending_status = None  # latest message waiting for _drain_status
+        self._status_lock = threading.Lock()
+        self._sr_recognizer = sr.Recognizer() if SPEECH_REC_AVAILABLE else None
+        self._sr_calibrated_at = None  # time.monotonic() of the last ambient-noise calibration
+        self._sr_microphone = None  # created on first use; construction probes PortAudio
+        self._pyttsx_engine = None  # created lazily and reused across utterances
+        self._closing = False  # set by _on_close; engine jobs still queued then are dropped
+        # The pyttsx3 engine is created, configured and stepped only on this thread: SAPI5
+        # COM objects belong to the thread that made them. Callers post via _with_engine
+        self._engine_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="engine")
+        # One long-lived worker runs speak/generate jobs in order, so they never overlap each
+        # other; auto-reading speaks from its own thread and meets them on the engine thread
+        self._tts_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
+        self._pending_future = None
+        # Downloads the next notification's Google TTS audio while the current one plays
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        # Single writer for the queue file and spoken log: keeps disk writes off the UI and
+        # speech threads, and applies them in the order they were requested
+        self._queue_io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="queue-io")
+        self._gtts_warmed = False
+        self._cache_dir_ready = False
+        self._last_engine_cfg = (None, None, None)  # (voice, rate, volume) last applied to the engine
 
         # Auto-reading state
         self.auto_reading_enabled = tk.BooleanVar(value=False)
         self.auto_reading_interval = tk.IntVar(value=10)  # seconds
         self.notification_queue = "notification_queue.txt"
+        self.spoken_log = "notification_queue.spoken"  # append-only spoken markers
+        self._spoken_keys = None  # loaded from spoken_log on first check
+        self._seen_texts = set()  # hash of every utterance queued this session, for dedup
         self.last_notification_check = 0
         self.auto_reading_thread = None
         self.auto_reading_active = False
-
-        # Init pygame mixer for playback
-        if PYGAME_AVAILABLE:
-            pygame.mixer.init()
-        else:
+        self._queue_observer = None  # watchdog observer, when available
+        self._auto_stop_evt = threading.Event()  # set to wake and end auto-reading waits
+        self._notif_check_lock = threading.Lock()
+        self._clear_requested = False  # Clear pressed while a check pass held the lock
+        self._notif_encoding = None  # encoding that last decoded the queue file
+        self._notif_last_mtime_ns = 0  # queue file mtime/size at the last check
+        self._notif_last_size = -1
+        self._queue_file_id = None  # (st_dev, st_ino) of the queue file being tailed
+        self._queue_offset = 0  # bytes of the queue file already parsed
+        self._queue_decoder = None  # incremental decoder, only for UTF-16 queue files
+        self._queue_partial = b""  # trailing line not yet terminated by a newline
+        self._pending_notifications = deque()  # parsed but not yet spoken
+        self._last_notif_key = None  # (mtime_ns, size) the cached last record was read at
+        self._last_notif = None
+
+        # The pygame mixer is opened on first playback (_ensure_mixer), not at startup
+        self._mixer_ready = False
+        self._mixer_lock = threading.Lock()
+        if not PYGAME_AVAILABLE:
             messagebox.showwarning("Missing Dependency", "pygame not available. Audio playback will not work.\nInstall with: pip install pygame")
 
         # Build UI
         self._build_ui()
+        self.master.after(self.STATUS_REFRESH_MS, self._drain_status)
+        if PYGAME_AVAILABLE:
+            self.master.after(self.MUSIC_PUMP_MS, self._pump_music_events)
 
         # Handle window close
         self.master.protocol("WM_DELETE_WINDOW", self._on_close)
 
-        # Load voices (in a thread to avoid UI stall if backend is slow)
-        threading.Thread(target=self._load_voices, daemon=True).start()
+        # Show the voices found last time straight away; otherwise enumerate them in a
+        # thread to avoid a UI stall if the backend is slow
+        cached_voices = self._load_voice_cache()
+        if cached_voices:
+            self.voices = cached_voices
+            self._populate_voice_combo()
+            self._set_status(f"Loaded {len(cached_voices)} voices.")
+            threading.Thread(target=self._warm_up_engines, daemon=True).start()
+        else:
+            threading.Thread(target=self._load_voices, daemon=True).start()
 
     # ---------- UI ----------
+    def _append_text(self, text):
+        """Add recognized speech to the text area as a new paragraph"""
+        if self.text_area.get("1.0", "end-1c").strip():
+            self.text_area.insert(tk.END, "\n\n" + text)
+        else:
+            self.text_area.delete("1.0", tk.END)
+            self.text_area.insert("1.0", text)
+
     def _build_ui(self):
         self._build_tts_ui(self.master)
 
@@ -149,6 +413,14 @@ class TTSApp:
         tb.Button(row, text="Play last", bootstyle=LINK, command=self._play_last_notification).pack(side="left", padx=8)
         tb.Button(row, text="Clear", bootstyle=LINK, command=self._clear_notifications).pack(side="left")
 
+        advanced = tb.Labelframe(left, text="Advanced", bootstyle=SECONDARY)
+        advanced.grid(row=4, column=0, columnspan=3, sticky="ew", padx=10, pady=(0,10))
+        row = tb.Frame(advanced); row.pack(fill="x", padx=10, pady=(8,10))
+        tb.Label(row, text="Audio buffer").pack(side="left")
+        tb.Combobox(row, width=6, state="readonly", values=self.AUDIO_BUFFER_CHOICES,
+                    textvariable=self.audio_buffer_var).pack(side="left", padx=6)
+        tb.Label(row, text="frames").pack(side="left")
+
         # RIGHT COLUMN — Text area & file
         right = tb.Frame(body)
         right.grid(row=0, column=1, sticky="nsew")
@@ -202,10 +474,12 @@ class TTSApp:
         self.is_speaking_live = False
         
         # Stop pygame mixer if playing
-        if PYGAME_AVAILABLE:
+        if PYGAME_AVAILABLE and self._mixer_ready:
             try:
                 if pygame.mixer.music.get_busy():
                     pygame.mixer.music.stop()
+                if self._channel is not None:
+                    self._channel.stop()
             except:
                 pass
             
@@ -217,152 +491,135 @@ class TTSApp:
             messagebox.showerror("Feature Unavailable", "Speech recognition not installed.\nInstall with: pip install SpeechRecognition")
             return
 
+        self._set_status("Listening... Speak now!")
+        self.voice_input_btn.config(state="disabled")
+
         def worker():
             try:
-                self._set_status("Listening... Speak now!")
-                self.voice_input_btn.config(state="disabled")
-
-                recognizer = sr.Recognizer()
-                with sr.Microphone() as source:
-                    recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                recognizer = self._sr_recognizer
+                if self._sr_microphone is None:
+                    self._sr_microphone = sr.Microphone()
+                with self._sr_microphone as source:
+                    now = time.monotonic()
+                    if (self._sr_calibrated_at is None or
+                            now - self._sr_calibrated_at > self.MIC_RECALIBRATE_SECONDS):
+                        recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                        self._sr_calibrated_at = now
                     audio = recognizer.listen(source, timeout=5, phrase_time_limit=10)
 
                 text = recognizer.recognize_google(audio)
-
-                current_text = self.text_area.get("1.0", tk.END).strip()
-                new_text = (current_text + "\n\n" + text) if current_text else text
-                self.text_area.delete("1.0", tk.END)
-                self.text_area.insert("1.0", new_text)
+                self.master.after(0, self._append_text, text)  # widgets belong to the UI thread
 
                 self._set_status(f"Voice input: '{text[:50]}...'")
 
             except sr.WaitTimeoutError:
+                self._sr_calibrated_at = None  # threshold may be off; recalibrate next time
                 self._set_status("Voice input timed out")
             except sr.UnknownValueError:
+                self._sr_calibrated_at = None
                 self._set_status("Could not understand audio")
-                messagebox.showwarning("Speech Recognition", "Could not understand the audio. Please try again.")
+                self.master.after(0, messagebox.showwarning, "Speech Recognition",
+                                  "Could not understand the audio. Please try again.")
             except sr.RequestError as e:
                 self._set_status(f"Speech recognition error: {e}")
-                messagebox.showerror("Speech Recognition Error", f"Could not request results: {e}")
+                self.master.after(0, messagebox.showerror, "Speech Recognition Error",
+                                  f"Could not request results: {e}")
             except Exception as e:
+                self._sr_calibrated_at = None
                 self._set_status(f"Voice input error: {e}")
-                messagebox.showerror("Voice Input Error", str(e))
+                self.master.after(0, messagebox.showerror, "Voice Input Error", str(e))
             finally:
-                self.voice_input_btn.config(state="normal")
+                self.master.after(0, lambda: self.voice_input_btn.config(state="normal"))
 
         threading.Thread(target=worker, daemon=True).start()
 
-    def _build_chat_ui(self, parent):
-        """Build the conversational AI chat interface"""
-        pass
-
     # ---------- Voice loading ----------
-    def _load_voices(self, max_retries=3):
+    def _load_voices(self):
         """Load both online and offline voices"""
         self._set_status("Loading voices…")
 
-        voices_loaded = False
-        self.voices = []
+        # Build the list locally and publish it once, so the UI never sees it half-filled
+        voices = list(ONLINE_VOICES) if GTTS_AVAILABLE else []
+        online_count = len(voices)
+        offline_count = 0
 
-        # Load online voices first (Google TTS)
-        if GTTS_AVAILABLE:
-            online_voices = [
-                {"name": "Google English (US)", "id": "en", "type": "online"},
-                {"name": "Google English (UK)", "id": "en-uk", "type": "online"},
-                {"name": "Google English (AU)", "id": "en-au", "type": "online"},
-                {"name": "Google Spanish", "id": "es", "type": "online"},
-                {"name": "Google French", "id": "fr", "type": "online"},
-                {"name": "Google German", "id": "de", "type": "online"},
-                {"name": "Google Italian", "id": "it", "type": "online"},
-                {"name": "Google Portuguese", "id": "pt", "type": "online"},
-                {"name": "Google Japanese", "id": "ja", "type": "online"},
-                {"name": "Google Korean", "id": "ko", "type": "online"},
-                {"name": "Google Chinese", "id": "zh", "type": "online"}
-            ]
-
-            self.voices.extend(online_voices)
-            voices_loaded = True
-            self._set_status(f"Loaded {len(online_voices)} online voices.")
-
-        # Always try to add system voices (pyttsx3) as well
+        # Always try to add system voices (pyttsx3) as well. Engine init either works or
+        # it doesn't, so there is no retry: a failure falls straight through to the fallback
         if PYTTSX3_AVAILABLE:
-            for attempt in range(max_retries):
-                try:
-                    try:
-                        import platform
-                        if platform.system() == "Windows":
-                            try:
-                                engine = pyttsx3.init('sapi5')
-                            except Exception:
-                                engine = pyttsx3.init()
-                        else:
-                            engine = pyttsx3.init()
-
-                        voices = engine.getProperty("voices")
-
-                        if voices and len(voices) > 0:
-                            offline_count = 0
-                            for v in voices:
-                                try:
-                                    if hasattr(v, 'name') and v.name:
-                                        name = v.name
-                                    elif hasattr(v, 'id') and v.id:
-                                        name = v.id
-                                    else:
-                                        name = f"Voice {len(self.voices)}"
-                                    voice_id = getattr(v, 'id', name)
-                                    self.voices.append({"name": name, "id": voice_id, "type": "offline"})
-                                    offline_count += 1
-                                except Exception:
-                                    continue
-
-                            if offline_count > 0:
-                                voices_loaded = True
-                                engine.stop()
-                                self._set_status(f"Loaded {len(self.voices)} total voices ({len(online_voices) if 'online_voices' in locals() else 0} online, {offline_count} system).")
-                                break
-
-                    except Exception as e:
-                        if attempt < max_retries - 1:
-                            time.sleep(1)
-                            continue
-                        else:
-                            if self.voices:
-                                voices_loaded = True
-                                self._set_status(f"Loaded {len(self.voices)} voices (online only).")
-                                break
-                            else:
-                                self.voices = [{"name": "Default Voice", "id": "default", "type": "offline"}]
-                                voices_loaded = True
-                                self._set_status("Using fallback voice (TTS engines unavailable).")
-                                break
+            try:
+                # Enumerate through the shared engine so it stays warm for the first utterance
+                for v in self._with_engine(lambda engine: engine.getProperty("voices")) or ():
+                    name = getattr(v, 'name', None) or getattr(v, 'id', None) or f"Voice {len(voices)}"
+                    voices.append({"name": name, "id": getattr(v, 'id', name), "type": "offline"})
+                    offline_count += 1
+            except Exception as e:
+                print(f"Error loading system voices: {e}")
 
-                except Exception:
-                    if attempt == max_retries - 1:
-                        if not self.voices:
-                            self.voices = [{"name": "Default Voice", "id": "default", "type": "offline"}]
-                            voices_loaded = True
-                            self._set_status("Using fallback voice (TTS engines unavailable).")
+        if offline_count:
+            status = f"Loaded {len(voices)} total voices ({online_count} online, {offline_count} system)."
+        elif voices:
+            status = f"Loaded {len(voices)} voices (online only)."
         else:
-            # pyttsx3 not available
-            if not self.voices:
-                self.voices = [{"name": "Default Voice", "id": "default", "type": "offline"}]
-                voices_loaded = True
-                self._set_status("Using fallback voice (pyttsx3 not available).")
-
-        if voices_loaded and self.voices:
-            names = [f"{i}: {v['name']}" for i, v in enumerate(self.voices)]
-            self.master.after(0, lambda: self._populate_voice_combo(names))
-            return
-        else:
-            error_msg = "Failed to load any voices"
-            self._set_status(error_msg)
-            self.master.after(0, lambda: messagebox.showerror("Voice Loading Error",
-                f"Could not load voices.\n\n{error_msg}\n\n"
-                "Try:\n• Restarting the application\n• Checking system TTS settings\n"
-                "• Installing additional TTS engines\n• Running: pip install pyttsx3"))
-
-    def _populate_voice_combo(self, names):
+            voices = [FALLBACK_VOICE]
+            status = ("Using fallback voice (TTS engines unavailable)." if PYTTSX3_AVAILABLE
+                      else "Using fallback voice (pyttsx3 not available).")
+        self.voices = voices
+        self._set_status(status)
+        if offline_count:
+            self._save_voice_cache(voices)
+
+        if GTTS_AVAILABLE and not self._gtts_warmed:
+            self._gtts_warmed = True
+            threading.Thread(target=self._warm_up_gtts, daemon=True).start()
+
+        self.master.after(0, self._populate_voice_combo)
+
+    @staticmethod
+    def _voice_signature():
+        # Cached voices are only trusted on the same OS build with the same backends
+        return f"{platform.platform()}|pyttsx3={PYTTSX3_AVAILABLE}|gtts={GTTS_AVAILABLE}"
+
+    def _load_voice_cache(self):
+        try:
+            with open(self.VOICE_CACHE_FILE, 'rb') as f:
+                cached = json_loads(f.read())
+            if cached.get("signature") == self._voice_signature():
+                return cached["voices"] or None
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        return None
+
+    def _save_voice_cache(self, voices):
+        try:
+            self.VOICE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp = f"{self.VOICE_CACHE_FILE}.tmp"
+            with open(tmp, 'w', encoding='utf-8') as f:
+                f.write(json_dumps({"signature": self._voice_signature(), "voices": voices}))
+            os.replace(tmp, self.VOICE_CACHE_FILE)
+        except OSError as e:
+            print(f"Error saving voice cache: {e}")
+
+    def _warm_up_engines(self):
+        """Create the shared pyttsx3 engine (and open the gTTS connection) in the background"""
+        if PYTTSX3_AVAILABLE:
+            try:
+                self._with_engine(lambda engine: None)
+            except Exception as e:
+                print(f"Error starting TTS engine: {e}")
+        if GTTS_AVAILABLE and not self._gtts_warmed:
+            self._gtts_warmed = True
+            self._warm_up_gtts()
+
+    def _warm_up_gtts(self):
+        """Make one tiny Google TTS request so the pooled connection is open before the first real one"""
+        try:
+            gTTS(text="hi", lang="en").write_to_fp(io.BytesIO())
+        except Exception as e:
+            print(f"Google TTS warm-up failed: {e}")
+
+    def _populate_voice_combo(self):
+        names = [f"{i}: {v['name']}" for i, v in enumerate(self.voices)]
+        self._voice_by_id = {v["id"]: v for v in self.voices}
         self.voice_combo["values"] = names
         if names:
             self.voice_combo.current(0)
@@ -376,6 +633,7 @@ class TTSApp:
             self.tts_engine = voice.get("type", "offline")
 
     def _refresh_voices(self):
+        self._voice_by_id = {}  # rebuilt by _populate_voice_combo once the reload finishes
         threading.Thread(target=self._load_voices, daemon=True).start()
 
     # ---------- File handling ----------
@@ -389,85 +647,405 @@ class TTSApp:
             # Automatically generate audio when file is selected
             self._generate_audio()
 
-    def _read_text(self):
-        text_content = self.text_area.get("1.0", tk.END).strip()
-        if text_content:
-            return text_content
+    def _text_area_text(self):
+        # Only re-fetch the widget contents when Tk reports an edit since last time
+        if self._text_cache is None or self.text_area.edit_modified():
+            self._text_cache = self.text_area.get("1.0", tk.END).strip()
+            self.text_area.edit_modified(False)
+        return self._text_cache
+
+    def _selected_file(self):
         path = self.selected_file_path.get().strip()
         if not path:
             raise ValueError("Please enter text or choose a text file first.")
-        if not os.path.exists(path):
+        return path
+
+    def _read_text(self):
+        if self._text_area_text():
+            return self._text_cache
+        path = self._selected_file()
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {path}")
-        with open(path, "r", encoding="utf-8") as f:
-            return f.read()
+        file_key = (path, st.st_mtime_ns, st.st_size)
+        if file_key != self._file_text_key:
+            with open(path, "r", encoding="utf-8") as f:
+                self._file_text = f.read()
+            self._file_text_key = file_key
+        return self._file_text
+
+    def _iter_sentence_batches(self, path):
+        """Yield the complete sentences in each chunk read from a text file"""
+        decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+        leftover = ""
+        with open(path, "rb", buffering=self.FILE_READ_CHUNK) as f:
+            while True:
+                chunk = f.read(self.FILE_READ_CHUNK)
+                text = leftover + decoder.decode(chunk, final=not chunk)
+                if not chunk:
+                    if text.strip():
+                        yield [text]
+                    return
+                sentences = self.SENTENCE_END_RE.split(text)
+                leftover = sentences.pop()  # may continue in the next chunk
+                batch = [s for s in sentences if s.strip()]
+                if batch:
+                    yield batch
 
     # ---------- TTS core ----------
-    def _configure_engine(self, engine: pyttsx3.Engine):
-        if self.selected_voice_id and self.tts_engine == "offline":
+    def _with_engine(self, action):
+        """Run action(engine) on the engine thread and return its result, blocking until done"""
+        return self._engine_executor.submit(self._engine_job, action).result()
+
+    def _engine_job(self, action):
+        # Engine thread only. A failure recreates the engine once and retries
+        if self._closing:
+            raise RuntimeError("Speech engine is shutting down")
+        try:
+            return action(self._get_engine())
+        except Exception:
+            self._discard_engine()
+        try:
+            return action(self._get_engine())
+        except Exception:
+            self._discard_engine()
+            raise
+
+    def _get_engine(self):
+        """Return the shared pyttsx3 engine, creating it on first use (engine thread only)"""
+        if self._pyttsx_engine is None:
+            if platform.system() == "Windows":
+                try:
+                    engine = pyttsx3.init('sapi5')
+                except Exception:
+                    engine = pyttsx3.init()
+            else:
+                engine = pyttsx3.init()
+            # One external run loop for the engine's lifetime: _run_engine steps it per
+            # utterance instead of paying runAndWait()'s loop setup and teardown each time
+            engine.startLoop(False)
+            engine.iterate()  # the first step clears the driver's initial busy state
+            self._pyttsx_engine = engine
+            self._last_engine_cfg = (None, None, None)
+        return self._pyttsx_engine
+
+    def _discard_engine(self):
+        """Drop a failed engine so the next job builds a fresh one (engine thread only)"""
+        engine, self._pyttsx_engine = self._pyttsx_engine, None
+        if engine is not None:
             try:
-                engine.setProperty("voice", self.selected_voice_id)
+                engine.endLoop()
             except Exception:
                 pass
+
+    def _run_engine(self, engine):
+        """Step the engine until its queued say/save commands finish; False if Skip/Stop cut them short"""
+        while engine.isBusy():
+            if self.stop_speech_flag:
+                engine.stop()
+                return False
+            engine.iterate()
+            time.sleep(0.01)
+        return True
+
+    def _configure_engine(self, engine: pyttsx3.Engine, settings):
+        voice_id, rate, volume = settings
+        self._apply_engine_settings(engine, voice_id if self.tts_engine == "offline" else None, rate, volume)
+
+    def _refresh_rate_volume(self, *_args):
         try:
-            engine.setProperty("rate", int(self.rate_var.get()))
-        except Exception:
-            pass
+            self._rate_volume = (int(self.rate_var.get()), float(self.volume_var.get()))
+        except (tk.TclError, ValueError):
+            pass  # transient non-numeric value; keep the last good one
+
+    def _refresh_audio_buffer(self, *_args):
         try:
-            engine.setProperty("volume", float(self.volume_var.get()))
-        except Exception:
+            buffer = int(self.audio_buffer_var.get())
+        except (tk.TclError, ValueError):
+            return
+        if buffer == self._audio_buffer:
+            return
+        self._audio_buffer = buffer
+        self._save_audio_buffer(buffer)
+        if self._mixer_ready:
+            self._set_status("Audio buffer change takes effect after restarting the app")
+
+    def _load_audio_buffer(self):
+        try:
+            with open(self.SETTINGS_FILE, 'rb') as f:
+                buffer = json_loads(f.read())["audio_buffer"]
+            if buffer in self.AUDIO_BUFFER_CHOICES:
+                return buffer
+        except (OSError, ValueError, KeyError, TypeError):
             pass
+        return self.AUDIO_BUFFER_FRAMES
 
-    def _generate_online_audio(self, text: str, output_path: str):
+    def _save_audio_buffer(self, buffer):
+        try:
+            self.SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp = f"{self.SETTINGS_FILE}.tmp"
+            with open(tmp, 'w', encoding='utf-8') as f:
+                f.write(json_dumps({"audio_buffer": buffer}))
+            os.replace(tmp, self.SETTINGS_FILE)
+        except OSError as e:
+            print(f"Error saving settings: {e}")
+
+    def _snapshot_settings(self):
+        """Return (voice_id, rate, volume) as plain values a worker thread can use"""
+        rate, volume = self._rate_volume
+        return self.selected_voice_id, rate, volume
+
+    def _apply_engine_settings(self, engine, voice_id, rate, volume):
+        """Set voice/rate/volume, skipping properties the engine already has (each set is a driver call)"""
+        last_voice, last_rate, last_volume = self._last_engine_cfg
+        if voice_id and voice_id != last_voice:
+            try:
+                engine.setProperty("voice", voice_id)
+                last_voice = voice_id
+            except Exception:
+                pass
+        if rate != last_rate:
+            try:
+                engine.setProperty("rate", rate)
+                last_rate = rate
+            except Exception:
+                pass
+        if volume != last_volume:
+            try:
+                engine.setProperty("volume", volume)
+                last_volume = volume
+            except Exception:
+                pass
+        self._last_engine_cfg = (last_voice, last_rate, last_volume)
+
+    def _generate_online_audio(self, text: str, output_path: str, lang: str):
         if not GTTS_AVAILABLE:
             raise Exception("Google TTS not available. Install with: pip install gtts")
         try:
-            tts = gTTS(text=text, lang=self.selected_voice_id, slow=False)
+            tts = gTTS(text=text, lang=lang, slow=False)
             tts.save(output_path)
         except Exception as e:
             raise Exception(f"Google TTS failed: {e}")
 
+    def _online_audio_bytes(self, text: str, lang: str) -> bytes:
+        """Synthesize text with Google TTS into memory and return the MP3 bytes"""
+        if not GTTS_AVAILABLE:
+            raise Exception("Google TTS not available. Install with: pip install gtts")
+        buf = io.BytesIO()
+        try:
+            gTTS(text=text, lang=lang, slow=False).write_to_fp(buf)
+        except Exception as e:
+            raise Exception(f"Google TTS failed: {e}")
+        return buf.getvalue()
+
+    def _split_sentences(self, text: str):
+        return [s for s in self.SENTENCE_END_RE.split(text.strip()) if s.strip()]
+
+    def _chunk_text(self, text: str, max_len: int = 200):
+        """Split text into pieces of at most max_len characters, breaking at sentence ends first"""
+        chunks = []
+        for sentence in self._split_sentences(text):
+            while len(sentence) > max_len:
+                cut = sentence.rfind(" ", 0, max_len)
+                if cut <= 0:
+                    cut = max_len
+                chunks.append(sentence[:cut])
+                sentence = sentence[cut:].lstrip()
+            if not sentence:
+                continue
+            if chunks and len(chunks[-1]) + 1 + len(sentence) <= max_len:
+                chunks[-1] += " " + sentence
+            else:
+                chunks.append(sentence)
+        return chunks
+
+    def _speak_online(self, text: str, lang: str):
+        """Speak with Google TTS, playing each chunk while the following ones download
+
+        Returns the whole MP3, or None if Skip/Stop cut playback short or it grew past
+        ONLINE_CACHE_MAX_BYTES (too big to keep in memory for the cache).
+        """
+        chunks = self._chunk_text(text)
+        pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gtts")
+        if len(chunks) <= 1:
+            try:
+                audio = self._await_audio(pool.submit(self._online_audio_bytes, text, lang))
+            finally:
+                pool.shutdown(wait=False)
+            if audio is None:
+                return None
+            self._load_music_bytes(audio)
+            self._play_music()
+            self._wait_for_music()
+            return None if self.stop_speech_flag else audio
+
+        # Downloads run at most ONLINE_PREFETCH_CHUNKS ahead of playback: a long text is
+        # fetched at the pace it is spoken, not in one burst
+        pending = iter(chunks)
+        futures = deque(pool.submit(self._online_audio_bytes, chunk, lang)
+                        for chunk in itertools.islice(pending, self.ONLINE_PREFETCH_CHUNKS))
+        parts, size = [], 0
+        channel = None
+        try:
+            while futures:
+                audio = self._await_audio(futures.popleft())
+                if audio is None:
+                    break
+                for chunk in itertools.islice(pending, 1):
+                    futures.append(pool.submit(self._online_audio_bytes, chunk, lang))
+                if parts is not None:
+                    size += len(audio)
+                    if size <= self.ONLINE_CACHE_MAX_BYTES:
+                        parts.append(audio)
+                    else:
+                        parts = None  # too long to cache: stop holding on to it
+                sound = pygame.mixer.Sound(file=io.BytesIO(audio))
+                if channel is None:
+                    channel = self._channel = pygame.mixer.find_channel(True)
+                    if pygame.display.get_init():
+                        channel.set_endevent(MUSIC_END_EVENT)
+                    self._music_done.clear()
+                    channel.play(sound)
+                    continue
+                # A channel holds one queued sound; wait until the current one hands over
+                while channel.get_queue() is not None and not self.stop_speech_flag:
+                    self._music_done.wait(0.1)
+                    self._music_done.clear()
+                channel.queue(sound)
+            while channel is not None and channel.get_busy() and not self.stop_speech_flag:
+                self._music_done.wait(0.1)
+                self._music_done.clear()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            if channel is not None:
+                channel.set_endevent()
+        if self.stop_speech_flag:
+            if channel is not None:
+                channel.stop()
+            return None
+        return b"".join(parts) if parts is not None else None
+
+    def _await_audio(self, future):
+        """Wait for a download, returning None as soon as Skip/Stop is pressed"""
+        # The abandoned request finishes (or times out) in the background; its result is dropped
+        while not self.stop_speech_flag:
+            try:
+                return future.result(timeout=0.1)
+            except FutureTimeout:
+                continue
+        future.cancel()
+        return None
+
+    def _generate_online_audio_parallel(self, text: str, output_path: str, lang: str) -> bool:
+        """Synthesize request-sized chunks concurrently and join them; MP3 frames concatenate cleanly
+
+        Returns False if Skip/Stop (or a newer job) interrupted a long, sequential run.
+        """
+        # Sentences merged up to one request each, so short sentences don't cost a request apiece
+        chunks = self._chunk_text(text, self.GTTS_CHUNK_CHARS)
+        if len(chunks) <= 1:
+            self._generate_online_audio(text, output_path, lang)
+            return True
+        if len(text) > self.ONLINE_PARALLEL_MAX_CHARS:
+            # Too many requests for a burst: pace them, and write each part as it arrives
+            with open(output_path, "wb") as f:
+                for chunk in chunks:
+                    if self.stop_speech_flag:
+                        return False
+                    try:
+                        f.write(self._online_audio_bytes(chunk, lang))
+                    except Exception:
+                        time.sleep(2)  # most likely rate limited (HTTP 429): one slower retry
+                        f.write(self._online_audio_bytes(chunk, lang))
+                    time.sleep(self.GTTS_SEQUENTIAL_DELAY)
+            return True
+        with ThreadPoolExecutor(max_workers=self.SYNTH_WORKERS) as pool:
+            futures = [pool.submit(self._online_audio_bytes, chunk, lang) for chunk in chunks]
+        parts = []
+        backed_off = False
+        for chunk, future in zip(chunks, futures):
+            try:
+                parts.append(future.result())
+            except Exception:
+                # Most likely rate limited (HTTP 429) by the burst: finish the remaining
+                # failures one request at a time once it has passed
+                if not backed_off:
+                    time.sleep(2)
+                    backed_off = True
+                parts.append(self._online_audio_bytes(chunk, lang))
+        with open(output_path, "wb") as f:
+            f.write(b"".join(parts))
+        return True
+
     def _speak_live(self):
         if self.is_speaking_live or self.is_generating:
             return
         try:
-            text = self._read_text()
+            batches = None
+            if self.tts_engine == "offline" and not self._text_area_text():
+                # Speak a file while it is read instead of loading it all first
+                path = self._selected_file()
+                if not os.path.exists(path):
+                    raise FileNotFoundError(f"File not found: {path}")
+                batches, text = self._iter_sentence_batches(path), None
+            else:
+                text = self._read_text()
         except Exception as e:
             messagebox.showerror("File error", str(e))
             return
+        settings = self._snapshot_settings()
+        online = self.tts_engine == "online"
 
         def worker():
             self.is_speaking_live = True
+            self.stop_speech_flag = False
             self._set_status("Speaking…")
             try:
-                if self.tts_engine == "online":
+                if online:
                     if not PYGAME_AVAILABLE:
                         raise Exception("pygame required for online TTS playback")
-                    with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
-                        temp_path = tmp.name
-                    self._generate_online_audio(text, temp_path)
-                    pygame.mixer.music.load(temp_path)
-                    pygame.mixer.music.play()
-                    while pygame.mixer.music.get_busy():
-                        time.sleep(0.1)
-                    try:
-                        os.unlink(temp_path)
-                    except:
-                        pass
+                    self._ensure_mixer()
+                    cache_path = self._cache_path(text, "mp3", settings)
+                    if self._cache_hit(cache_path):
+                        self._load_music(cache_path)
+                        self._play_music()
+                        self._wait_for_music()
+                    else:
+                        # Play from memory as chunks arrive; cache only a complete recording
+                        audio = self._speak_online(text, settings[0])
+                        if audio is not None:
+                            self._store_in_cache(cache_path, audio)
                     self._set_status("Done speaking.")
                 else:
-                    engine = pyttsx3.init()
-                    self._configure_engine(engine)
-                    engine.say(text)
-                    engine.runAndWait()
-                    engine.stop()
+                    def say(engine):
+                        self._configure_engine(engine, settings)
+                        if batches is None:
+                            engine.say(text)
+                            self._run_engine(engine)
+                            return
+                        for batch in batches:
+                            if self.stop_speech_flag:
+                                break
+                            for sentence in batch:
+                                engine.say(sentence)
+                            self._run_engine(engine)
+                    self._with_engine(say)
                     self._set_status("Done speaking.")
             except Exception as e:
                 self._set_status(f"Error speaking: {e}")
-                messagebox.showerror("TTS Error", f"Could not speak.\n\n{e}")
+                self.master.after(0, messagebox.showerror, "TTS Error", f"Could not speak.\n\n{e}")
             finally:
                 self.is_speaking_live = False
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._submit_tts(worker)
+
+    def _submit_tts(self, fn, *args):
+        """Queue a job on the TTS worker, superseding whatever is queued or playing"""
+        previous = self._pending_future
+        if previous is not None and not previous.cancel() and not previous.done():
+            self.stop_speech_flag = True  # already running: ask it to wrap up
+        self._pending_future = self._tts_executor.submit(fn, *args)
 
     def _generate_audio(self):
         if self.is_generating or self.is_speaking_live:
@@ -477,94 +1055,351 @@ class TTSApp:
         except Exception as e:
             messagebox.showerror("File error", str(e))
             return
+        settings = self._snapshot_settings()
+        online = self.tts_engine == "online"
+
+        self._enable_playback_controls(False)  # Disable controls while generating
 
         def worker():
             self.is_generating = True
-            self._enable_playback_controls(False)  # Disable controls while generating
+            self.stop_speech_flag = False  # a Skip/Stop from earlier must not cut this short
             self._set_status("Generating audio…")
-            ext = "mp3" if self.tts_engine == "online" else "wav"
-            tmpdir = tempfile.gettempdir()
-            out_path = os.path.join(tmpdir, f"tts_output.{ext}")
+            ext = "mp3" if online else "wav"
+
+            def synthesize(path):
+                if online:
+                    return self._generate_online_audio_parallel(text, path, settings[0])
+                def save(engine):
+                    self._configure_engine(engine, settings)
+                    engine.save_to_file(text, path)
+                    return self._run_engine(engine)
+                return self._with_engine(save)
 
             try:
-                if self.tts_engine == "online":
-                    self._generate_online_audio(text, out_path)
-                else:
-                    engine = pyttsx3.init()
-                    self._configure_engine(engine)
-                    engine.save_to_file(text, out_path)
-                    engine.runAndWait()
-                    engine.stop()
+                out_path = self._cache_path(text, ext, settings)
+                if not self._cache_hit(out_path):
+                    if not self._synthesize_to_cache(out_path, synthesize):
+                        self._set_status("Generation cancelled")
+                        # The previous recording is untouched and can still be played
+                        self.master.after(0, self._enable_playback_controls,
+                                          self.current_audio_path is not None)
+                        return
+                    if self._music_path == out_path:
+                        self._music_path = None  # file was rewritten: load it afresh
 
                 self.current_audio_path = out_path
-                self._enable_playback_controls(True)
+                self._audio_path_verified = out_path  # just written or hit in the cache
+                self._current_sound = self._preload_sound(out_path)
+                self.master.after(0, self._enable_playback_controls, True)
                 self._set_status(f"Audio generated: {out_path}")
 
             except Exception as e:
                 self._set_status(f"Error generating audio: {e}")
-                messagebox.showerror("TTS Error", f"Could not generate audio.\n\n{e}")
+                self.master.after(0, messagebox.showerror, "TTS Error", f"Could not generate audio.\n\n{e}")
             finally:
                 self.is_generating = False
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._submit_tts(worker)
+
+    # ---------- Audio cache ----------
+    def _cache_path(self, text: str, ext: str, settings) -> str:
+        """Return the cache file for text spoken with the current voice settings"""
+        # One encode + one OpenSSL-backed digest; surrogatepass keeps Tk surrogate
+        # pairs (e.g. emoji) hashable without collapsing distinct texts together
+        # ext stands in for the engine: gTTS writes mp3, pyttsx3 writes wav
+        voice_id, rate, volume = settings
+        data = f"{ext}|{voice_id}|{rate}|{volume}|{text}".encode("utf-8", "surrogatepass")
+        key = hashlib.sha256(data).hexdigest()
+        if not self._cache_dir_ready:
+            self.AUDIO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            self._cache_dir_ready = True
+        return str(self.AUDIO_CACHE_DIR / f"{key}.{ext}")
+
+    def _cache_hit(self, path: str) -> bool:
+        """Check for a cached file, bumping its access time for LRU eviction"""
+        if not os.path.exists(path):
+            return False
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return True
+
+    @staticmethod
+    def _cache_tmp_path(path: str) -> str:
+        # Same extension, since some engines pick the output format from it
+        stem, ext = os.path.splitext(path)
+        return f"{stem}.tmp{threading.get_ident()}{ext}"
+
+    def _synthesize_to_cache(self, path: str, synthesize) -> bool:
+        """Run synthesize() into a temp file and move it into place, so a hit is always complete
+
+        synthesize returns False when it was interrupted; the partial file is then
+        discarded and False is returned.
+        """
+        tmp = self._cache_tmp_path(path)
+        completed = False
+        try:
+            if synthesize(tmp):
+                os.replace(tmp, path)
+                completed = True
+        finally:
+            if not completed:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+        if completed:
+            self._prune_cache(keep=path)
+        return completed
+
+    def _store_in_cache(self, path: str, data: bytes):
+        """Write already-synthesized audio into the cache"""
+        tmp = self._cache_tmp_path(path)
+        try:
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"Error writing audio cache: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+        self._prune_cache(keep=path)
+
+    def _expire_cache(self):
+        """Remove cached audio not played within AUDIO_CACHE_TTL_SECONDS"""
+        cutoff = time.time() - self.AUDIO_CACHE_TTL_SECONDS
+        try:
+            entries = list(os.scandir(self.AUDIO_CACHE_DIR))
+        except OSError:
+            return  # no cache yet
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_atime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                continue
+
+    def _prune_cache(self, keep=None):
+        """Evict least recently used files once the cache exceeds AUDIO_CACHE_MAX_BYTES"""
+        try:
+            entries = []
+            total = 0
+            for entry in os.scandir(self.AUDIO_CACHE_DIR):
+                if entry.is_file():
+                    st = entry.stat()
+                    entries.append((st.st_atime, st.st_size, entry.path))
+                    total += st.st_size
+        except OSError as e:
+            print(f"Error scanning audio cache: {e}")
+            return
+
+        entries.sort()
+        for _atime, size, path in entries:
+            if total <= self.AUDIO_CACHE_MAX_BYTES:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue  # e.g. still held open by the mixer
 
     # ---------- Playback via pygame ----------
+    def _ensure_mixer(self):
+        """Open the audio device the first time something is played"""
+        with self._mixer_lock:
+            if self._mixer_ready:
+                return
+            pygame.mixer.init(frequency=self.AUDIO_SAMPLE_RATE, size=-16, channels=2,
+                              buffer=self._audio_buffer)
+            self._mixer_ready = True  # _pump_music_events picks this up on the UI thread
+
     def _ensure_loaded(self):
         if not PYGAME_AVAILABLE:
             messagebox.showerror("Playback Error", "pygame not available for audio playback")
             return False
-        if not self.current_audio_path or not os.path.exists(self.current_audio_path):
+        path = self.current_audio_path
+        if not path or (path != self._audio_path_verified and not os.path.exists(path)):
             messagebox.showwarning("No audio", "Generate audio first to enable playback.")
             return False
+        self._audio_path_verified = path
         return True
 
+    def _preload_sound(self, path):
+        """Decode a generated WAV into a Sound; MP3s and large files stream via mixer.music"""
+        if not PYGAME_AVAILABLE or not path.endswith(".wav"):
+            return None
+        try:
+            if os.path.getsize(path) > self.SOUND_PRELOAD_MAX_BYTES:
+                return None
+            self._ensure_mixer()
+            return pygame.mixer.Sound(path)
+        except Exception:
+            return None
+
     def _play_audio(self):
         if not self._ensure_loaded():
             return
         try:
-            pygame.mixer.music.load(self.current_audio_path)
-            pygame.mixer.music.play()
+            self._ensure_mixer()
+            if self._current_sound is not None:
+                if self._channel is not None:
+                    self._channel.stop()
+                self._channel = self._current_sound.play()
+            else:
+                self._load_music(self.current_audio_path)
+                pygame.mixer.music.play()  # restarts from the top when the track is already loaded
             self._set_status("Playing audio…")
         except Exception as e:
+            self._audio_path_verified = None  # e.g. deleted behind our back: stat it next time
             self._set_status(f"Playback error: {e}")
             messagebox.showerror("Playback Error", str(e))
 
     def _pause_audio(self):
-        if not PYGAME_AVAILABLE:
+        if not PYGAME_AVAILABLE or not self._mixer_ready:
             return
         try:
+            if self._channel is not None:
+                self._channel.pause()
             pygame.mixer.music.pause()
             self._set_status("Paused.")
         except Exception as e:
             self._set_status(f"Pause error: {e}")
 
     def _unpause_audio(self):
-        if not PYGAME_AVAILABLE:
+        if not PYGAME_AVAILABLE or not self._mixer_ready:
             return
         try:
+            if self._channel is not None:
+                self._channel.unpause()
             pygame.mixer.music.unpause()
             self._set_status("Playing…")
         except Exception as e:
             self._set_status(f"Unpause error: {e}")
 
     def _stop_audio(self):
-        if not PYGAME_AVAILABLE:
+        if not PYGAME_AVAILABLE or not self._mixer_ready:
             return
         try:
+            if self._channel is not None:
+                self._channel.stop()
             pygame.mixer.music.stop()
             self._set_status("Stopped.")
         except Exception as e:
             self._set_status(f"Stop error: {e}")
 
     def _rewind_audio(self):
-        if not PYGAME_AVAILABLE:
+        if not PYGAME_AVAILABLE or not self._mixer_ready:
             return
         try:
-            pygame.mixer.music.rewind()
+            if self._channel is not None and self._channel.get_sound() is self._current_sound:
+                self._channel.stop()
+                self._channel = self._current_sound.play()
+            else:
+                pygame.mixer.music.rewind()
             self._set_status("Rewound to start.")
         except Exception as e:
             self._set_status(f"Rewind error: {e}")
 
+    def _load_music(self, path):
+        """Load a file into mixer.music, skipping the open and header decode if it is already loaded"""
+        if path != self._music_path:
+            self._music_path = None  # stays None if the load fails part-way
+            pygame.mixer.music.load(path)
+            self._music_path = path
+
+    def _load_music_bytes(self, audio: bytes):
+        """Load MP3 bytes into the mixer from memory, or via the reused spill file if unsupported"""
+        self._music_path = None
+        try:
+            pygame.mixer.music.load(io.BytesIO(audio), "mp3")
+        except (pygame.error, TypeError):
+            try:
+                pygame.mixer.music.unload()  # release the previous spill file (Windows)
+            except (AttributeError, pygame.error):
+                pass
+            self.SPILL_DIR.mkdir(parents=True, exist_ok=True)
+            with open(self._tts_buf_path, "wb") as f:
+                f.write(audio)
+            pygame.mixer.music.load(self._tts_buf_path)
+
+    def _drain_tmp(self):
+        while self._tmp_cleanup:
+            path = self._tmp_cleanup.popleft()
+            try:
+                os.unlink(path)
+            except OSError:
+                pass  # never created, or already gone
+
+    def _remove_stale_tmp(self):
+        """Delete spill files left behind by earlier runs that did not exit cleanly"""
+        windows = platform.system() == "Windows"
+        for path in self.SPILL_DIR.glob("tts_*.mp3"):
+            match = re.fullmatch(r"tts_(\d+)\.mp3", path.name)
+            if not match or str(path) == self._tts_buf_path:
+                continue
+            # POSIX happily unlinks a file another instance has open, so ask whether its
+            # owner is still running. (os.kill(pid, 0) would terminate it on Windows, but
+            # there an open file simply refuses to be deleted.)
+            if not windows and self._pid_alive(int(match.group(1))):
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                pass  # in use by another running instance
+
+    @staticmethod
+    def _pid_alive(pid: int) -> bool:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except OSError:
+            return True  # e.g. EPERM: exists, owned by someone else
+        return True
+
+    def _pump_music_events(self):
+        """Turn pygame's end-of-track events into _music_done so waiters can block on it"""
+        # Runs on the Tk thread: SDL wants its event queue set up and pumped from one
+        # thread, and an after() tick avoids a dedicated thread parked in event.wait()
+        if self._mixer_ready:
+            try:
+                if not pygame.display.get_init():
+                    pygame.display.init()  # the event queue lives in the video subsystem
+                    pygame.mixer.music.set_endevent(MUSIC_END_EVENT)
+                for evt in pygame.event.get():
+                    if evt.type == MUSIC_END_EVENT:
+                        self._music_done.set()
+            except pygame.error:
+                return  # no video driver (or shut down): playback waits fall back to polling
+        self.master.after(self.MUSIC_PUMP_MS, self._pump_music_events)
+
+    def _play_music(self):
+        """Start the loaded track; _wait_for_music blocks until it ends"""
+        self._music_done.clear()
+        pygame.mixer.music.play()
+
+    def _wait_for_music(self):
+        """Block until the current track ends or Skip/Stop is pressed"""
+        # With the event pump running this wakes on the end event; the timeout only
+        # bounds how long a Skip/Stop takes to notice, and covers the no-display case
+        timeout = 0.25 if pygame.display.get_init() else 0.1
+        music = pygame.mixer.music
+        music_done = self._music_done
+        while True:
+            ended = music_done.wait(timeout)
+            if self.stop_speech_flag or not music.get_busy():
+                break
+            if ended:
+                music_done.clear()  # late event from a previously stopped track
+        if self.stop_speech_flag:
+            music.stop()
+
     def _enable_playback_controls(self, enabled: bool):
         state = "normal" if enabled else "disabled"
         for btn in (self.play_btn, self.pause_btn, self.unpause_btn, self.stop_btn, self.rewind_btn):
@@ -586,168 +1421,423 @@ class TTSApp:
         if self.auto_reading_active:
             return
         self.auto_reading_active = True
-        self.auto_reading_thread = threading.Thread(target=self._auto_reading_worker, daemon=True)
+        self._auto_stop_evt.clear()
+        if WATCHDOG_AVAILABLE and self._start_queue_observer():
+            self._set_status("Auto-reading enabled (watching for new notifications)")
+            return
+        # Read on the Tk thread and handed over: the worker never touches Tk variables
+        try:
+            interval = max(1, int(self.auto_reading_interval.get()))
+        except (tk.TclError, ValueError):
+            interval = 10  # half-typed spinbox value; fall back to the default
+        self.auto_reading_thread = threading.Thread(target=self._auto_reading_worker,
+                                                    args=(interval,), daemon=True)
+        self.auto_reading_thread.start()
+        self._set_status(f"Auto-reading enabled (checking every {interval}s)")
+
+    def _start_queue_observer(self):
+        """Watch the queue file for changes instead of polling it; returns False on failure"""
+        queue_path = os.path.abspath(self.notification_queue)
+        try:
+            observer = Observer()
+            observer.schedule(QueueFileHandler(queue_path, self._check_notifications),
+                              os.path.dirname(queue_path), recursive=False)
+            observer.start()
+        except Exception as e:
+            print(f"Could not watch notification queue, falling back to polling: {e}")
+            return False
+        self._queue_observer = observer
+        # Pick up anything queued before the watch started
+        self.auto_reading_thread = threading.Thread(target=self._check_notifications, daemon=True)
         self.auto_reading_thread.start()
-        self._set_status(f"Auto-reading enabled (checking every {self.auto_reading_interval.get()}s)")
+        return True
 
     def _stop_auto_reading(self):
         self.auto_reading_active = False
+        self._auto_stop_evt.set()
+        if self._queue_observer:
+            self._queue_observer.stop()
+            self._queue_observer.join(timeout=2)
+            self._queue_observer = None
         if self.auto_reading_thread:
             self.auto_reading_thread.join(timeout=2)
         self._set_status("Auto-reading disabled")
 
-    def _auto_reading_worker(self):
+    def _auto_reading_worker(self, interval):
         while self.auto_reading_active:
             try:
                 self._check_notifications()
             except Exception as e:
                 print(f"Auto-reading error: {e}")
-            time.sleep(self.auto_reading_interval.get())
+            if self._auto_stop_evt.wait(interval):
+                break
 
     def _check_notifications(self):
-        if not os.path.exists(self.notification_queue):
-            return
-        try:
-            notifications = []
-            encodings_to_try = ['utf-8', 'utf-16', 'utf-16-le', 'utf-16-be', 'latin-1']
-            content = None
-            for encoding in encodings_to_try:
-                try:
-                    with open(self.notification_queue, 'r', encoding=encoding) as f:
-                        content = f.read()
-                    break
-                except UnicodeDecodeError:
-                    continue
-            if content is None:
-                print("Could not decode notification file with any known encoding")
+        # Called from the polling worker or the file watcher; never run two passes at once
+        with self._notif_check_lock:
+            self._apply_pending_clear()
+            try:
+                st = os.stat(self.notification_queue)
+            except OSError:
                 return
+            changed = (st.st_mtime_ns, st.st_size) != (self._notif_last_mtime_ns, self._notif_last_size)
+            if not changed and not self._pending_notifications:
+                return  # nothing appended and nothing left over from an interrupted pass
+            self._notif_last_mtime_ns, self._notif_last_size = st.st_mtime_ns, st.st_size
+            try:
+                if changed:
+                    self._queue_new_notifications(st)
 
-            for line in content.splitlines():
-                line = line.strip()
-                if line:
-                    try:
-                        notification = json.loads(line)
-                        if not notification.get('spoken', False):
-                            notifications.append(notification)
-                    except json.JSONDecodeError:
-                        continue
-
-            for notification in notifications:
-                if not self.auto_reading_active or self.stop_speech_flag:
-                    break
-                message = notification['message']
-                source = notification.get('source', 'unknown')
-                if source.startswith('log:'):
-                    prefix = "Log update: "
-                elif source == 'email':
-                    prefix = "Email: "
-                else:
-                    prefix = "Notification: "
-                full_message = f"{prefix}{message}"
-                self._speak_text_live(full_message)
-                if self.stop_speech_flag:
-                    break
-                notification['spoken'] = True
-                self._update_notification_status(notification)
-                if self.auto_reading_active and not self.stop_speech_flag:
-                    time.sleep(2)
+                prefetched = None  # (text, lang, Future) for the batch after the current one
+                while self._pending_notifications:
+                    if not self.auto_reading_active or self.stop_speech_flag:
+                        break
+                    self._apply_pending_clear()
+                    if not self._pending_notifications:
+                        break
+                    batch, text = self._notification_batch(0)
+                    settings = self._snapshot_settings()
+                    voice = self._voice_by_id.get(settings[0])
+                    lang = settings[0] if voice and voice['type'] == 'online' else None
+                    audio = None
+                    if prefetched and prefetched[:2] == (text, lang):
+                        audio = prefetched[2]
+                    elif prefetched:
+                        prefetched[2].cancel()
+                    prefetched = None
+                    if lang and len(self._pending_notifications) > len(batch):
+                        _, upcoming = self._notification_batch(len(batch))
+                        if not os.path.exists(self._cache_path(upcoming, "mp3", settings)):
+                            prefetched = (upcoming, lang, self._prefetch_pool.submit(
+                                self._online_audio_bytes, upcoming, lang))
+                    if not self._speak_text_live(text, settings, audio):
+                        break  # failed: keep the batch pending so the next pass retries it
+                    # Finished, or skipped on purpose: either way it is done with
+                    self._mark_spoken(batch)
+                    for _ in batch:
+                        if self._pending_notifications:  # may have been cleared meanwhile
+                            self._pending_notifications.popleft()
+                    if self.auto_reading_active and not self.stop_speech_flag:
+                        self._auto_stop_evt.wait(2)
+
+                if prefetched:
+                    prefetched[2].cancel()
+
+                if not self._pending_notifications and self._queue_offset >= self.QUEUE_COMPACT_BYTES:
+                    # Run after any marker appends still in flight, never alongside them
+                    self._queue_io.submit(self._compact_queue).result()
 
-        except Exception as e:
-            print(f"Error checking notifications: {e}")
+            except Exception as e:
+                print(f"Error checking notifications: {e}")
+
+    def _compact_queue(self):
+        """Cut a fully spoken queue down to its newest record and reset the spoken log to match"""
+        path = self.notification_queue
+        if self._queue_partial or self._notif_encoding not in ("utf-8", "utf-8-sig"):
+            return  # mid-line, or a UTF-16 file that can't be split on b'\n'
+        window = 64 * 1024
+        with open(path, 'rb') as f:
+            f.seek(max(0, self._queue_offset - window))
+            tail = f.read(self._queue_offset - f.tell())
+        lines = [line for line in tail.split(b'\n') if line.strip()]
+        last = lines[-1] if lines else b''
+        try:
+            key = self._spoken_key(json_loads(last.removeprefix(codecs.BOM_UTF8)))
+        except (ValueError, TypeError, AttributeError):
+            last, key = b'', None
 
-    def _update_notification_status(self, notification):
+        tmp = f"{path}.compact"
+        # Its own backup name: ".backup" is the copy Clear promises to keep
+        backup = f"{path}.compacted"
         try:
-            encodings_to_try = ['utf-8', 'utf-16', 'utf-16-le', 'utf-16-be', 'latin-1']
-            content = None
-            encoding_used = None
-            for encoding in encodings_to_try:
-                try:
-                    with open(self.notification_queue, 'r', encoding=encoding) as f:
-                        content = f.read()
-                    encoding_used = encoding
-                    break
-                except UnicodeDecodeError:
+            with open(tmp, 'wb') as f:
+                if last:
+                    f.write(last + b'\n')
+            # The monitor script may append at any moment: only swap if nothing arrived
+            # since the last read. The remaining window is the two renames below
+            if os.path.getsize(path) != self._queue_offset:
+                return
+            os.replace(path, backup)
+            try:
+                os.replace(tmp, path)
+            except OSError:
+                os.replace(backup, path)  # put the full queue back rather than lose it
+                raise
+        finally:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass  # already moved into place
+
+        spoken_tmp = f"{self.spoken_log}.compact"
+        with open(spoken_tmp, 'w', encoding='utf-8') as f:
+            if key is not None:
+                f.write(json_dumps({'ts': key[0], 'h': key[1]}) + '\n')
+        os.replace(spoken_tmp, self.spoken_log)
+        self._spoken_keys = {self._spoken_id(*key)} if key is not None else set()
+
+        st = os.stat(path)
+        self._queue_file_id = (st.st_dev, st.st_ino)
+        self._queue_offset = st.st_size
+        self._queue_decoder = None
+        self._notif_encoding = "utf-8"
+        self._notif_last_mtime_ns, self._notif_last_size = st.st_mtime_ns, st.st_size
+
+    def _queue_new_notifications(self, st):
+        """Parse only the lines appended since the last read and queue the unspoken ones"""
+        file_id = (st.st_dev, st.st_ino)
+        if file_id != self._queue_file_id or st.st_size < self._queue_offset:
+            # New, replaced or truncated queue file: start again from the top
+            self._queue_file_id = file_id
+            self._queue_offset = 0
+            self._notif_encoding = None
+            self._queue_decoder = None
+            self._queue_partial = b""
+            # Unspoken items will be read again: don't let them count as duplicates then
+            self._seen_texts.difference_update(
+                hash(n['_spoken_text']) for n in self._pending_notifications)
+            self._pending_notifications.clear()
+
+        spoken_keys = self._load_spoken_keys()
+        duplicates = []
+        for line in self._iter_queue_appends():
+            # No strip(): JSON parsers skip the surrounding newline/CRLF themselves,
+            # and a blank line simply fails to parse
+            try:
+                notification = json_loads(line)
+            except ValueError:
+                if not isinstance(line, bytes) or not line.strip():
                     continue
-            if content is None:
-                print("Could not decode notification file with any known encoding")
+                try:  # stray invalid UTF-8: parse what survives replacement
+                    notification = json_loads(line.decode('utf-8', errors='replace'))
+                except ValueError:
+                    continue
+            # A malformed record is skipped here: an exception escaping this loop would
+            # leave the rest of the already-consumed lines unread until the file next changes
+            if not isinstance(notification, dict) or not isinstance(notification.get('message'), str):
+                continue
+            try:
+                if (notification.get('spoken', False) or
+                        self._spoken_id(*self._spoken_key(notification)) in spoken_keys):
+                    continue
+                # Build the utterance once here rather than on every batch/prefetch pass
+                text = self._notification_text(notification).strip()
+            except (TypeError, AttributeError):
+                continue  # e.g. a non-string source or an unhashable timestamp
+            if text[-1:] not in ".!?":
+                text += "."  # sentence end, so the voice pauses between notifications
+            text_hash = hash(text)
+            if text_hash in self._seen_texts:
+                duplicates.append(notification)  # already said this session
+                continue
+            if len(self._seen_texts) >= self.SEEN_TEXTS_MAX:
+                self._seen_texts.clear()
+            self._seen_texts.add(text_hash)
+            notification['_spoken_text'] = text
+            self._pending_notifications.append(notification)
+        if duplicates:
+            self._mark_spoken(duplicates)
+
+    def _iter_queue_appends(self):
+        """Yield the complete lines written to the queue file since the previous call
+
+        UTF-8 lines come back as raw bytes (json_loads takes them without a decode step)
+        and are read one at a time, so a large backlog is never held in memory at once.
+        """
+        with open(self.notification_queue, 'rb') as f:
+            if self._notif_encoding is None:
+                self._notif_encoding = self._sniff_encoding(f.read(4))
+                if self._notif_encoding == 'utf-16':
+                    self._queue_decoder = codecs.getincrementaldecoder('utf-16')(errors='replace')
+                    self._queue_partial = ""
+            f.seek(self._queue_offset)
+            if self._queue_decoder is None:
+                for raw in f:
+                    self._queue_offset += len(raw)
+                    if not raw.endswith(b'\n'):
+                        # Still being written: hold it until its newline arrives
+                        self._queue_partial += raw
+                        break
+                    line, self._queue_partial = self._queue_partial + raw, b""
+                    if self._queue_offset == len(line):
+                        line = line.removeprefix(codecs.BOM_UTF8)  # first line of the file
+                    yield line
                 return
+            while True:
+                raw = f.read(64 * 1024)
+                if not raw:
+                    return
+                self._queue_offset += len(raw)
+                lines = (self._queue_partial + self._queue_decoder.decode(raw)).split('\n')
+                self._queue_partial = lines.pop()
+                yield from lines
+
+    def _notification_batch(self, start):
+        """Join pending notifications from start into one utterance of up to MAX_BATCH_CHARS"""
+        batch, parts, size = [], [], 0
+        for notification in itertools.islice(self._pending_notifications, start, None):
+            text = notification['_spoken_text']
+            if batch and size + len(text) > self.MAX_BATCH_CHARS:
+                break
+            batch.append(notification)
+            parts.append(text)
+            size += len(text) + 1
+        return batch, " ".join(parts)
+
+    @staticmethod
+    def _notification_text(notification):
+        """Return the message to speak, prefixed by where it came from"""
+        source = notification.get('source', 'unknown')
+        if source.startswith('log:'):
+            prefix = "Log update: "
+        else:
+            prefix = NOTIFICATION_PREFIXES.get(source, "Notification: ")
+        return prefix + (notification.get('message') or '')
+
+    @staticmethod
+    def _sniff_encoding(head: bytes) -> str:
+        """Pick a decoder from a BOM; files without one are UTF-8 (what the monitor writes)"""
+        if head.startswith(b'\xef\xbb\xbf'):
+            return 'utf-8-sig'
+        if head.startswith((b'\xff\xfe', b'\xfe\xff')):
+            return 'utf-16'
+        return 'utf-8'
+
+    # Spoken state lives in an append-only sidecar log so marking a notification
+    # costs one small append instead of rewriting the whole queue file.
+    @staticmethod
+    def _spoken_key(notification):
+        message = notification.get('message', '')
+        digest = hashlib.sha256(message.encode('utf-8', 'surrogatepass')).hexdigest()[:16]
+        return (notification.get('timestamp'), digest)
+
+    @staticmethod
+    def _spoken_id(ts, digest):
+        """Fold a spoken-log marker into one int: the in-memory set holds these, not tuples"""
+        # A bare int costs a fraction of a (str, str) tuple per entry; the ids only have to
+        # agree within this process, so the built-in (per-run salted) hash is fine here
+        return hash((ts, digest))
+
+    def _load_spoken_keys(self):
+        """Return the set of spoken notification ids, reading the log once"""
+        if self._spoken_keys is None:
+            keys = set()
+            try:
+                with open(self.spoken_log, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            marker = json_loads(line)
+                            keys.add(self._spoken_id(marker['ts'], marker['h']))
+                        except (ValueError, KeyError, TypeError):
+                            continue
+            except FileNotFoundError:
+                pass
+            self._spoken_keys = keys
+        return self._spoken_keys
 
-            notifications = []
-            for line in content.splitlines():
-                line = line.strip()
-                if line:
-                    try:
-                        notif = json.loads(line)
-                        if (notif.get('timestamp') == notification.get('timestamp') and
-                            notif.get('message') == notification.get('message')):
-                            notif['spoken'] = True
-                        notifications.append(notif)
-                    except json.JSONDecodeError:
-                        continue
-
-            with open(self.notification_queue, 'w', encoding='utf-8') as f:
-                for notif in notifications:
-                    f.write(json.dumps(notif) + '\n')
+    def _mark_spoken(self, notifications):
+        """Record notifications as spoken by appending one marker line each, in one write"""
+        keys = [self._spoken_key(n) for n in notifications]
+        self._load_spoken_keys().update(self._spoken_id(ts, h) for ts, h in keys)
+        payload = ''.join(json_dumps({'ts': ts, 'h': h}) + '\n' for ts, h in keys)
+        self._queue_io.submit(self._append_spoken, payload)
 
+    def _append_spoken(self, payload):
+        try:
+            with open(self.spoken_log, 'a', encoding='utf-8') as f:
+                f.write(payload)
         except Exception as e:
             print(f"Error updating notification status: {e}")
 
     def _clear_notifications(self):
+        # The in-memory state belongs to the check pass. If one is running (it holds the
+        # lock while speaking), it applies the clear between batches; never block Tk here
+        self._clear_requested = True
+        if self._notif_check_lock.acquire(blocking=False):
+            try:
+                self._apply_pending_clear()
+            finally:
+                self._notif_check_lock.release()
+        self._queue_io.submit(self._clear_notification_files)
+
+    def _apply_pending_clear(self):
+        """Drop pending notifications after Clear; caller holds _notif_check_lock"""
+        if not self._clear_requested:
+            return
+        self._clear_requested = False
+        # Never spoken, so the same text arriving later must not count as a duplicate
+        self._seen_texts.difference_update(
+            hash(n['_spoken_text']) for n in self._pending_notifications)
+        self._pending_notifications.clear()
+        self._spoken_keys = set()
+
+    def _clear_notification_files(self):
         try:
-            if os.path.exists(self.notification_queue):
-                backup_name = f"{self.notification_queue}.backup"
-                if os.path.exists(backup_name):
-                    os.remove(backup_name)
-                os.rename(self.notification_queue, backup_name)
-            Path(self.notification_queue).touch()
+            try:
+                # Atomic swap that overwrites any older backup in the same step
+                os.replace(self.notification_queue, f"{self.notification_queue}.backup")
+            except FileNotFoundError:
+                pass
+            open(self.notification_queue, 'wb').close()
+            # Compact the spoken log: nothing in the fresh queue has been spoken yet
+            try:
+                os.remove(self.spoken_log)
+            except FileNotFoundError:
+                pass
             self._set_status("Notifications cleared (backup created)")
         except Exception as e:
             self._set_status(f"Error clearing notifications: {e}")
 
-    def _speak_text_live(self, text):
+    def _speak_text_live(self, text, settings=None, audio=None):
+        """Speak text and block until done; audio is an optional Future of its online MP3
+
+        Returns False if speaking failed with an error, True once it finished or was
+        cut short by Skip/Stop.
+        """
         if not text.strip():
-            return
+            return True
+        failed = False
+        if settings is None:
+            settings = self._snapshot_settings()
+        voice_id, rate, volume = settings
         try:
             self.is_speaking_live = True
             self.stop_speech_flag = False
             self._set_status("Speaking...")
 
-            selected_voice = None
-            if self.selected_voice_id:
-                for voice in self.voices:
-                    if voice['id'] == self.selected_voice_id:
-                        selected_voice = voice
-                        break
+            selected_voice = self._voice_by_id.get(voice_id)
 
             if selected_voice and selected_voice['type'] == 'online':
                 if not PYGAME_AVAILABLE:
                     raise Exception("pygame required for online TTS playback")
-                tts = gTTS(text=text, lang=selected_voice['id'], slow=False)
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as temp_file:
-                    temp_file_path = temp_file.name
-                    tts.save(temp_file_path)
-                pygame.mixer.music.load(temp_file_path)
-                pygame.mixer.music.play()
-                while pygame.mixer.music.get_busy() and self.is_speaking_live and not self.stop_speech_flag:
-                    pygame.time.wait(100)
-                if self.stop_speech_flag:
-                    pygame.mixer.music.stop()
-                try:
-                    os.unlink(temp_file_path)
-                except:
-                    pass
+                self._ensure_mixer()
+                cache_path = self._cache_path(text, "mp3", settings)
+                if self._cache_hit(cache_path):
+                    if audio is not None:
+                        audio.cancel()
+                    self._load_music(cache_path)
+                    self._play_music()
+                    self._wait_for_music()
+                elif audio is not None:
+                    data = self._await_audio(audio)
+                    if data is not None:
+                        self._load_music_bytes(data)
+                        self._play_music()
+                        self._wait_for_music()
+                        if not self.stop_speech_flag:
+                            self._store_in_cache(cache_path, data)
+                else:
+                    data = self._speak_online(text, voice_id)
+                    if data is not None:
+                        self._store_in_cache(cache_path, data)
             else:
                 if not self.stop_speech_flag:
-                    engine = pyttsx3.init()
-                    if selected_voice:
-                        try:
-                            engine.setProperty('voice', selected_voice['id'])
-                        except:
-                            pass
-                    engine.setProperty('rate', self.rate_var.get())
-                    engine.setProperty('volume', self.volume_var.get())
-                    engine.say(text)
-                    engine.runAndWait()
+                    def say(engine):
+                        self._apply_engine_settings(engine, selected_voice['id'] if selected_voice else None,
+                                                    rate, volume)
+                        engine.say(text)
+                        self._run_engine(engine)
+                    self._with_engine(say)
 
             if self.stop_speech_flag:
                 self._set_status("Speech interrupted")
@@ -755,51 +1845,95 @@ class TTSApp:
                 self._set_status("Speech completed.")
 
         except Exception as e:
+            failed = not self.stop_speech_flag  # an error caused by stopping is just a stop
             self._set_status(f"Speech error: {e}")
         finally:
             self.is_speaking_live = False
             self.stop_speech_flag = False
+        return not failed
 
     # ---------- Helpers ----------
     def _set_status(self, msg: str):
-        self.status_var.set(msg)
+        # Safe from any thread: only records the message; _drain_status shows the latest
+        with self._status_lock:
+            self._pending_status = msg
+
+    def _drain_status(self):
+        """Apply the newest pending status on the UI thread, at most every STATUS_REFRESH_MS"""
+        with self._status_lock:
+            msg, self._pending_status = self._pending_status, None
+        if msg is not None and msg != self.status_var.get():
+            self.status_var.set(msg)
+        self.master.after(self.STATUS_REFRESH_MS, self._drain_status)
 
     def _on_close(self):
+        # Executor threads are joined at interpreter exit, so every worker loop has to
+        # notice it should stop, or the process keeps talking after the window is gone
+        self.stop_speech_flag = True
+        self.auto_reading_active = False
+        self._auto_stop_evt.set()
         try:
-            if PYGAME_AVAILABLE:
+            if PYGAME_AVAILABLE and self._mixer_ready:
                 pygame.mixer.music.stop()
                 pygame.mixer.quit()
         except Exception:
             pass
+        # The engine itself is stopped by its own thread, which sees stop_speech_flag. Jobs
+        # still queued behind it are dropped, then its run loop is ended on that same thread
+        self._closing = True
+        engine_done = self._engine_executor.submit(self._discard_engine)
+        self._engine_executor.shutdown(wait=False)
+        try:
+            engine_done.result(timeout=2)
+        except Exception:
+            pass  # stuck driver: exit anyway
+        self._tts_executor.shutdown(wait=False, cancel_futures=True)
+        self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+        self._queue_io.shutdown(wait=True)  # flush spoken markers so nothing repeats next run
         self.master.destroy()
 
     def _get_last_notification(self):
-        if not os.path.exists(self.notification_queue):
+        """Return the newest parseable record by reading back from the end of the queue"""
+        try:
+            st = os.stat(self.notification_queue)
+        except OSError:
             return None
+        key = (st.st_mtime_ns, st.st_size)
+        if key == self._last_notif_key:
+            return self._last_notif  # queue untouched since the last lookup
+        size = st.st_size
         try:
-            encodings_to_try = ['utf-8', 'utf-16', 'utf-16-le', 'utf-16-be', 'latin-1']
-            content = None
-            for encoding in encodings_to_try:
-                try:
-                    with open(self.notification_queue, 'r', encoding=encoding) as f:
-                        content = f.read()
-                    break
-                except UnicodeDecodeError:
-                    continue
-            if content is None:
-                print("Could not decode notification file with any known encoding")
-                return None
-
-            notifications = []
-            for line in content.splitlines():
-                line = line.strip()
-                if line:
-                    try:
-                        notification = json.loads(line)
-                        notifications.append(notification)
-                    except json.JSONDecodeError:
-                        continue
-            return notifications[-1] if notifications else None
+            window = 64 * 1024
+            notification = None
+            with open(self.notification_queue, 'rb') as f:
+                head = f.read(4)
+                wide = self._sniff_encoding(head) == 'utf-16'
+                if wide:  # a hand-saved UTF-16 file; the monitor itself writes UTF-8
+                    encoding = 'utf-16-le' if head.startswith(b'\xff\xfe') else 'utf-16-be'
+                while notification is None:
+                    start = max(0, size - window)
+                    if wide:
+                        start -= start % 2  # stay on a code-unit boundary
+                    f.seek(start)
+                    chunk = f.read(size - start)
+                    if wide:
+                        lines = chunk.decode(encoding, errors='replace').lstrip('\ufeff').split('\n')
+                    else:
+                        lines = chunk.split(b'\n')
+                    if start > 0:
+                        lines = lines[1:]  # probably starts mid-line
+                    for line in reversed(lines):
+                        try:
+                            # Both parsers take UTF-8 bytes; drop a BOM on the very first line
+                            notification = json_loads(line if wide else line.removeprefix(codecs.BOM_UTF8))
+                            break
+                        except ValueError:
+                            continue
+                    if start == 0:
+                        break
+                    window *= 4  # nothing complete in the tail; look further back
+            self._last_notif_key, self._last_notif = key, notification
+            return notification
 
         except Exception as e:
             print(f"Error reading last notification: {e}")
@@ -812,19 +1946,9 @@ class TTSApp:
             messagebox.showinfo("No Notifications", "There are no notifications in the queue.")
             return
 
-        message = last_notif['message']
-        source = last_notif.get('source', 'unknown')
-
-        if source.startswith('log:'):
-            prefix = "Log update: "
-        elif source == 'email':
-            prefix = "Email: "
-        else:
-            prefix = "Notification: "
-
-        full_message = f"{prefix}{message}"
-        self._set_status(f"Speaking last notification: {message[:50]}...")
-        threading.Thread(target=self._speak_text_live, args=(full_message,), daemon=True).start()
+        full_message = self._notification_text(last_notif)
+        self._set_status(f"Speaking last notification: {last_notif['message'][:50]}...")
+        self._submit_tts(self._speak_text_live, full_message, self._snapshot_settings())
 
 def main():
     app = tb.Window(themename="darkly")